@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from dataclasses import dataclass
+from types import MappingProxyType
 
 if TYPE_CHECKING:
     from termgame import TermGame
@@ -8,20 +9,75 @@ if TYPE_CHECKING:
 # TODO: Make collision handler wrapper functions and decorate collision handlers
 #       in game objects
 class GameObject:
-    label = None
+    # label and sprites are shared by every instance of a game object class,
+    # subclasses override them as class attributes. The default sprites is
+    # read only so filling it in place fails instead of leaking between classes.
+    label: str = None
+    sprites: dict[str, list[str]] = MappingProxyType({})
+
+    __slots__ = (
+        "id",
+        "game",
+        "parent",
+        "position",
+        "collision",
+        "collision_cell",
+        "_is_collider",
+        "moved",
+        "layer",
+        "current_sprite",
+        "current_sprite_frame",
+        "key_map",
+        "input_keys",
+    )
 
     def __init__(self, label: str, game: TermGame, parent=None) -> None:
+        if label != type(self).label:
+            raise ValueError(
+                f"{type(self).__name__} spawned as {label!r}, "
+                f"its class label is {type(self).label!r}"
+            )
         self.id = None
-        self.label: str = label
         self.game: TermGame = game
         self.parent = parent
-        self.position: tuple(int, int) = None
+        # once spawned, change position with move_abs/move_rel and the
+        # collision layer with set_layer, not by assignment, so the game's
+        # collision map stays in sync
+        self.position: tuple[int, int] = None
         self.collision: Collision = Collision()
+        self.collision_cell: tuple[int, tuple[int, int]] = None
+        self._is_collider: bool = False  # mirrors collision.collider once spawned
+        self.moved: bool = False
         self.layer: int = 0
-        self.sprites: dict[str, list[str]] = {}
         self.current_sprite: str = None
         self.current_sprite_frame: int = 0
         self.key_map: dict[str:function] = None
+        self.input_keys: tuple[str, ...] = ()  # keys indexed by the game
+
+    def set_collider(self, collider: bool) -> None:
+        """Turn collisions for this object on or off after it has spawned.
+
+        Args:
+            collider (bool): whether the object should be considered for collisions
+        """
+        self.collision.collider = collider
+        if collider:
+            self.game.enable_collider(self)
+        else:
+            self.game.disable_collider(self)
+
+    def set_layer(self, layer: int) -> None:
+        """Move this object to another collision layer.
+
+        Args:
+            layer (int): new collision layer
+        """
+        self.collision.layer = layer
+        if self.collision_cell:
+            collision_map = self.game.collision_map
+            position = self.collision_cell[1]
+            collision_map.remove_obj(*self.collision_cell, self)
+            collision_map.add_obj(layer, position, self)
 
     def start(self):
         pass
@@ -75,7 +131,7 @@ class GameObject:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Collision:
     """Class containing all collision related attributes.
 
@@ -1,9 +1,8 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import sys, gameobjects, scenes, types, curses
-from collections import defaultdict, namedtuple
+import sys, gameobjects, scenes, types, curses, heapq, itertools
+from collections import defaultdict, deque, namedtuple
 from time import time_ns
-from queue import PriorityQueue
 
 if TYPE_CHECKING:
     from gameobject import GameObject
@@ -13,6 +12,27 @@ To Do: Add OnCollisionEnter, OnCollisionExit, OnCollisionStay
 
     """
 
+_CollisionTuple = namedtuple("Collision", ["layer", "position", "colliders"])
+
+
+def _insert_by_id(game_objs: dict[int, GameObject], game_obj: GameObject) -> None:
+    """Insert game_obj into an id -> game object dict, keeping the dict in id
+    (spawn) order. Ids only grow, so it only needs re-sorting when an object
+    is re-inserted after a later one.
+
+    Args:
+        game_objs (dict[int, GameObject]): dict to insert into
+        game_obj (GameObject): game object to insert
+    """
+    if game_obj.id in game_objs:
+        return
+    last_id = next(reversed(game_objs), None)
+    game_objs[game_obj.id] = game_obj
+    if last_id is not None and game_obj.id < last_id:
+        ordered = sorted(game_objs.items())
+        game_objs.clear()
+        game_objs.update(ordered)
+
 
 class TermGame:
     def __init__(self, screen: curses.window):
@@ -23,44 +43,121 @@ class TermGame:
         self.max_y -= 1
         self.max_x -= 1
         self.collision_map = self.CollisionMap(self)
-        self.collision = namedtuple("Collision", ["layer", "position", "colliders"])
         self.now = time_ns()
         self.last_frame_time = None
         self.frame_delay = 0.01
+        self.frame_delay_ns = int(self.frame_delay * 1000000000)
         self.next_game_obj_id = 0
         self.game_stopped = False
         self.resources = {}
         self.active_objects = {}
+        self.input_index = {}
+        self.objects_by_label = {}
+        self.drawable = {}
         self.debug_mode = True
-        self.debug_log = []
-        self.move_requests = []
+        self.debug_log = deque(maxlen=15)
+        self.prev_cells = None  # (y, x, text) drawn in the last frame
+        self.move_requests: dict[int, tuple[GameObject, tuple[int, int]]] = {}
         self.__load_resources()
 
     class CollisionMap:
         def __init__(self, game):
             self.game = game
-            self.map = defaultdict(lambda: defaultdict(list))
-            self.collision = namedtuple("Collision", ["layer", "position", "colliders"])
+            self.map = {}
+            self.cells_by_layer = defaultdict(set)
+            self.multi = set()  # keys of cells holding more than one object
+
+        @staticmethod
+        def pack(layer: int, position: tuple[int, int]) -> int:
+            """Pack a layer and screen position into a single int cell key.
+            y and x are stored as signed 32 bit fields, the layer above them.
+            Positions must lie in [-2**31, 2**31) on both axes, outside that
+            range distinct cells would share a key.
+
+            Args:
+                layer (int): collision layer
+                position (tuple[int, int]): screen position (y, x)
+
+            Returns:
+                int: cell key
+            """
+            y, x = position
+            return (layer << 64) | ((y & 0xFFFFFFFF) << 32) | (x & 0xFFFFFFFF)
+
+        @staticmethod
+        def unpack(key: int) -> tuple[int, tuple[int, int]]:
+            """Reverse of pack. Return the (layer, (y, x)) for a cell key."""
+            y = (key >> 32) & 0xFFFFFFFF
+            x = key & 0xFFFFFFFF
+            if y & 0x80000000:
+                y -= 0x100000000
+            if x & 0x80000000:
+                x -= 0x100000000
+            return key >> 64, (y, x)
 
         def __iter__(self):
-            for layer, position in self.map.items():
-                for position, game_obj_list in self.map[layer].items():
-                    yield (layer, position, game_obj_list)
+            for key, game_obj_list in self.map.items():
+                layer, position = self.unpack(key)
+                yield (layer, position, game_obj_list)
 
         def add_obj(self, layer, position, game_obj):
-            self.map[layer][position].append(game_obj)
+            key = self.pack(layer, position)
+            game_objs = self.map.setdefault(key, [])
+            game_objs.append(game_obj)
+            if len(game_objs) == 2:
+                self.multi.add(key)
+            self.cells_by_layer[layer].add(key)
+            game_obj.collision_cell = (layer, position)
+
+        def add_objs(self, game_objs_by_cell: dict[tuple, list[GameObject]]) -> None:
+            """Add many objects at once, with a single map probe per cell.
+
+            Args:
+                game_objs_by_cell (dict[tuple, list[GameObject]]): game objects
+                    keyed by their (layer, position) cell
+            """
+            for (layer, position), game_objs in game_objs_by_cell.items():
+                key = self.pack(layer, position)
+                cell = self.map.get(key)
+                if cell is None:
+                    cell = self.map[key] = list(game_objs)
+                else:
+                    cell.extend(game_objs)
+                if len(cell) > 1:
+                    self.multi.add(key)
+                self.cells_by_layer[layer].add(key)
+                for game_obj in game_objs:
+                    game_obj.collision_cell = (layer, position)
 
         def remove_obj(self, layer, position, game_obj):
-            if game_obj in self.map[layer][position]:
-                self.map[layer][position].remove(game_obj)
+            key = self.pack(layer, position)
+            game_objs = self.map.get(key)
+            if not game_objs:
+                return
+            try:
+                game_objs.remove(game_obj)
+            except ValueError:
+                return
+            game_obj.collision_cell = None
+            if len(game_objs) < 2:
+                self.multi.discard(key)
+            if not game_objs:
+                del self.map[key]
+                self.cells_by_layer[layer].discard(key)
+                if not self.cells_by_layer[layer]:
+                    del self.cells_by_layer[layer]
 
         def __detect_collisions(self):
-            collisions = []
-            for layer, position in self.map.items():
-                for position, game_objs in self.map[layer].items():
-                    if len(game_objs) > 1:
-                        collisions.append(self.collision(layer, position, game_objs))
-            return collisions
+            unpack = self.unpack
+            return [
+                _CollisionTuple(*unpack(key), self.map[key]) for key in self.multi
+            ]
+
+        def any_multi(self) -> Optional[int]:
+            """Return the key of any cell holding more than one object, or None
+            if there are no such cells.
+            """
+            return next(iter(self.multi), None)
 
         def get_collisions(self, layer=None, position=None):
             pass
@@ -69,44 +166,48 @@ class TermGame:
             specific_layer = layer
             specific_position = position
             rigidbody_collisions = []
-            collisions = self.__detect_collisions()
-            if collisions:
-                for collision in collisions:
-                    if specific_layer and collision.layer != specific_layer:
-                        continue
-                    if specific_position and collision.position != specific_position:
-                        continue
-                    rigidbody_colliders = [
-                        game_obj
-                        for game_obj in collision.colliders
-                        if game_obj.collision.rigidbody
-                    ]
-                    if len(rigidbody_colliders) > 1:
-                        rb_collision = self.collision(
-                            collision.layer, collision.position, rigidbody_colliders
-                        )
-                        if single:
-                            return rb_collision
-                        else:
-                            rigidbody_collisions.append(rb_collision)
+            if self.any_multi() is None:
+                return None if single else rigidbody_collisions
+            # the single path walks the cell keys lazily and stops at the first hit
+            unpack = self.unpack
+            collisions = (
+                (_CollisionTuple(*unpack(key), self.map[key]) for key in self.multi)
+                if single
+                else self.__detect_collisions()
+            )
+            for collision in collisions:
+                if specific_layer and collision.layer != specific_layer:
+                    continue
+                if specific_position and collision.position != specific_position:
+                    continue
+                rigidbody_colliders = [
+                    game_obj
+                    for game_obj in collision.colliders
+                    if game_obj.collision.rigidbody
+                ]
+                if len(rigidbody_colliders) > 1:
+                    rb_collision = _CollisionTuple(
+                        collision.layer, collision.position, rigidbody_colliders
+                    )
+                    if single:
+                        return rb_collision
+                    else:
+                        rigidbody_collisions.append(rb_collision)
+            if not single:
+                return rigidbody_collisions
 
     def __load_resources(self) -> None:
         """Check the project directory and subdirectories for game resources
         and load them into the resources dict.
         """
-        classes = []
-        for resource in (gameobjects, scenes):
-            object_modules = [
-                mod
-                for _, mod in resource.__dict__.items()
-                if isinstance(mod, types.ModuleType)
-            ]
-            for obj in object_modules:
-                classes.extend(
-                    [cls for _, cls in obj.__dict__.items() if isinstance(cls, type)]
-                )
-            for cls in classes:
-                self.resources[cls.label] = cls
+        self.resources = {
+            cls.label: cls
+            for resource in (gameobjects, scenes)
+            for mod in vars(resource).values()
+            if isinstance(mod, types.ModuleType)
+            for cls in vars(mod).values()
+            if isinstance(cls, type) and getattr(cls, "label", None)
+        }
 
     def __new_game_object(self, label: str, parent: GameObject = None) -> GameObject:
         """Instantiate new object from self.resources into
@@ -123,16 +224,40 @@ class TermGame:
         game_obj.id = self.next_game_obj_id
         self.next_game_obj_id += 1
         self.active_objects[game_obj.id] = game_obj
+        self.register_keys(game_obj)
         return game_obj
 
+    def register_keys(self, game_obj: GameObject) -> None:
+        """Index game_obj under the keys of its key_map. Call again after
+        game_obj's key_map has changed.
+
+        Args:
+            game_obj (GameObject): game object to index
+        """
+        if game_obj.id not in self.active_objects:
+            return
+        self.__unregister_keys(game_obj)
+        game_obj.input_keys = tuple(game_obj.key_map or ())
+        for key in game_obj.input_keys:
+            _insert_by_id(self.input_index.setdefault(key, {}), game_obj)
+
+    def __unregister_keys(self, game_obj: GameObject) -> None:
+        for key in game_obj.input_keys:
+            game_objs = self.input_index[key]
+            del game_objs[game_obj.id]
+            if not game_objs:
+                del self.input_index[key]
+        game_obj.input_keys = ()
+
     def __stop_game(self, reason: str) -> None:
         self.game_stopped = True
         self.screen.addstr(0, 30, f"[{reason}]")
         self.screen.refresh()
         while self.game_stopped:
-            key_pressed = self.__get_input()
+            key_pressed = self.__get_input(timeout=-1)
             if key_pressed and key_pressed in ("r"):
                 self.game_stopped = False
+                self.prev_cells = None  # redraw over the pause message
             elif key_pressed and key_pressed in ("q"):
                 sys.exit()
 
@@ -154,41 +279,58 @@ class TermGame:
             self.__loop()
 
     def __loop(self) -> None:
+        # wait for a key press, at most until the next frame is due
+        key_pressed = self.__get_input(timeout=self.__get_frame_timeout())
         self.now = time_ns()
-        self.__handle_input()
+        self.__handle_input(key_pressed)
         self.__update_objects()
         self.__move_objects()
         self.__draw_frame()
 
-    def __get_input(self) -> str:
-        """Return the key pressed or an empty string.
+    def __get_frame_timeout(self) -> int:
+        """Get the milliseconds left until the next frame is due, rounded up.
+
+        Returns:
+            int: milliseconds until the next frame, 0 if it is already due
+        """
+        if self.last_frame_time is None:
+            return 0
+        remaining = self.frame_delay_ns - (time_ns() - self.last_frame_time)
+        return max(0, -(-remaining // 1000000))
+
+    def __get_input(self, timeout: int = 0) -> str:
+        """Return the key pressed or an empty string. Waits for a key press
+        through curses, so keys curses has already buffered are seen.
+
+        Args:
+            timeout (int, optional): milliseconds to wait for a key press, -1 to
+                                     wait indefinitely. Defaults to 0.
 
         Returns:
             str: key pressed or empty string if no key pressed
         """
+        self.screen.timeout(timeout)
         try:
             key_pressed = self.screen.getkey()
             return key_pressed
         except:
             return ""
 
-    def __handle_input(self) -> None:
-        """Check for key press and call the handle_input function
+    def __handle_input(self, key_pressed: str) -> None:
+        """Handle a key press by calling the handle_input function
         of all objects that have that key in their key_map.
+
+        Args:
+            key_pressed (str): key pressed or empty string if no key pressed
         """
         game_obj: GameObject
-        key_pressed = self.__get_input()
         if key_pressed and key_pressed in ("q"):
             self.__stop_game("paused")
         elif key_pressed == ":":
             self.debug_mode = not self.debug_mode
         elif key_pressed:
-            input_handlers = [
-                game_obj
-                for _, game_obj in self.active_objects.items()
-                if game_obj.key_map and key_pressed in game_obj.key_map
-            ]
-            for game_obj in input_handlers:
+            # copy, handlers may spawn or destroy objects
+            for game_obj in tuple(self.input_index.get(key_pressed, {}).values()):
                 game_obj.handle_input(key_pressed)
 
     def spawn_obj(
@@ -198,7 +340,8 @@ class TermGame:
         parent: GameObject = None,
     ) -> GameObject:
         """Instantiate the object with the given label into
-        the active_objects dict. Return the new active_object.
+        the active_objects dict, register it for drawing and collisions.
+        Return the new active_object.
 
         Args:
             obj_label (string): class variable label for desired object
@@ -209,43 +352,118 @@ class TermGame:
             GameObject: the newly spawned game object
         """
         if obj_label in self.resources:
-            game_obj = self.__new_game_object(obj_label, parent=parent)
-            game_obj.position = position
+            game_obj = self.__spawn_unmapped(obj_label, position, parent)
+            if game_obj.collision.collider:
+                self.enable_collider(game_obj)
+            return game_obj
+
+    def spawn_many(
+        self, specs: list[tuple[str, tuple[int, int], GameObject]]
+    ) -> list[GameObject]:
+        """Spawn several objects, then add all colliders to the collision map
+        in one pass grouped by cell. Labels not found in resources are skipped.
+
+        Args:
+            specs (list[tuple[str, tuple[int, int], GameObject]]): (label,
+                position, parent) of each object to spawn
+
+        Returns:
+            list[GameObject]: the newly spawned game objects
+        """
+        game_objs = []
+        cells = defaultdict(list)
+        for obj_label, position, parent in specs:
+            if obj_label not in self.resources:
+                continue
+            game_obj = self.__spawn_unmapped(obj_label, position, parent)
+            game_objs.append(game_obj)
+            if game_obj.collision.collider:
+                self.__register_collider(game_obj)
+                if position:
+                    cells[(game_obj.collision.layer, position)].append(game_obj)
+        self.collision_map.add_objs(cells)
+        return game_objs
+
+    def __spawn_unmapped(
+        self, obj_label: str, position: tuple[int, int], parent: GameObject
+    ) -> GameObject:
+        """Create and register a game object, except in the collision map."""
+        game_obj = self.__new_game_object(obj_label, parent=parent)
+        game_obj.position = position
+        self.objects_by_label.setdefault(game_obj.label, {})[game_obj.id] = game_obj
+        self.drawable[game_obj.id] = game_obj
+        return game_obj
+
+    def enable_collider(self, game_obj: GameObject) -> None:
+        """Mark an active game object as a collider and, if it has a
+        position, add it to the collision map. Objects that become colliders after
+        spawning call this through GameObject.set_collider.
+
+        Args:
+            game_obj (GameObject): game object to start colliding
+        """
+        if game_obj.id not in self.active_objects:
+            return
+        self.__register_collider(game_obj)
+        if game_obj.position and not game_obj.collision_cell:
             self.collision_map.add_obj(
                 game_obj.collision.layer, game_obj.position, game_obj
             )
-            # self.screen_map[game_obj.layer][game_obj.position].append(game_obj.id)
-            return game_obj
+
+    def __register_collider(self, game_obj: GameObject) -> None:
+        """Mark game_obj as a collider, without touching the collision map."""
+        game_obj._is_collider = True
+
+    def disable_collider(self, game_obj: GameObject) -> None:
+        """Stop a game object colliding and remove it from the collision map.
+
+        Args:
+            game_obj (GameObject): game object to stop colliding
+        """
+        game_obj._is_collider = False
+        if game_obj.collision_cell:
+            self.collision_map.remove_obj(*game_obj.collision_cell, game_obj)
 
     def __draw_frame(self) -> None:
-        """Erase the screen, draw all active objects, refresh the screen."""
+        """Collect the text to draw for all active objects. If it differs
+        from the last frame, erase the screen, draw it and refresh the screen.
+        curses only sends changed cells to the terminal on refresh, so an
+        unchanged frame is skipped entirely.
+        """
         if self.__ready_for_next_frame():
-            self.screen.erase()
-            self.__draw_game_objects()
+            self.last_frame_time = self.now
+            cells = []
+            self.__draw_game_objects(cells)
             if self.debug_mode:
-                self.__draw_debug_console()
+                self.__draw_debug_console(cells)
+            if cells == self.prev_cells:
+                return
+            self.screen.erase()
+            for y, x, text in cells:
+                self.screen.addstr(y, x, text)
             self.screen.refresh()
+            self.prev_cells = cells
 
     def __ready_for_next_frame(self) -> bool:
-        """Determine if self.frame_delay seconds have passed
+        """Determine if self.frame_delay_ns nanoseconds have passed
         since the last frame was drawn.
 
         Returns:
-            bool: True if time passed > self.frame_delay, else False
+            bool: True if time passed >= self.frame_delay_ns, else False
         """
-        if not self.last_frame_time:
-            return True
-        if self.get_time_delta(self.last_frame_time) > self.frame_delay:
-            return True
+        return (
+            self.last_frame_time is None
+            or self.now - self.last_frame_time >= self.frame_delay_ns
+        )
 
-    def __draw_debug_console(self):
+    def __draw_debug_console(self, cells: list[tuple[int, int, str]]) -> None:
         debug_console_y = int(self.max_y * 0.3)
-        for position, entry in enumerate(self.debug_log[:debug_console_y]):
-            self.screen.addstr(self.max_y - (position + 1), 0, entry)
+        entries = itertools.islice(self.debug_log, debug_console_y)
+        for position, entry in enumerate(entries):
+            cells.append((self.max_y - (position + 1), 0, entry))
 
     def log(self, caller, message):
-        self.debug_log.insert(0, f"{self.now/1000000000}: {caller.label}: {message}")
-        self.debug_log = self.debug_log[:15]
+        self.debug_log.appendleft(f"{self.now/1000000000}: {caller.label}: {message}")
 
     def get_time_delta(self, then: int) -> float:
         """Get the time between self.now and then and return
@@ -263,120 +481,203 @@ class TermGame:
     def __update_objects(self) -> None:
         """Iterate over active objects and call their update function."""
         game_obj: GameObject
-        game_object_ids = list(self.active_objects.keys())
-        for game_obj_id in game_object_ids:
-            self.active_objects[game_obj_id].update()
+        # snapshot, updates may spawn or destroy objects
+        active_objects = self.active_objects
+        for game_obj in tuple(active_objects.values()):
+            if game_obj.id in active_objects:  # not destroyed earlier this pass
+                game_obj.update()
 
     def move(self, game_obj, position):
-        self.move_requests.append((game_obj, position))
+        if game_obj.id not in self.active_objects:
+            # destroyed earlier this frame
+            return
+        game_obj.moved = True
+        # last request of the frame wins
+        self.move_requests[game_obj.id] = (game_obj, position)
 
     def __move_objects(self):
+        """Apply the frame's move requests to the collision map, resolve
+        rigidbody collisions, then update the position of every moved object.
+        Only the collision map cells of moved objects are touched.
+        """
         game_obj: GameObject
 
         rigidbody_collisions = defaultdict(list)
         # move all objects to requested position
         if not self.move_requests:
             return
-        while self.move_requests:
-            game_obj, position = self.move_requests.pop()
-            self.collision_map.remove_obj(
-                game_obj.collision.layer, game_obj.position, game_obj
-            )
-            self.collision_map.add_obj(game_obj.collision.layer, position, game_obj)
-        collision = self.collision_map.get_rb_collisions(single=True)
+        add_obj = self.collision_map.add_obj
+        remove_obj = self.collision_map.remove_obj
+        get_rb_collisions = self.collision_map.get_rb_collisions
+        moved_colliders = []
+        for game_obj, position in self.move_requests.values():
+            if not game_obj.moved:
+                # destroyed since the request was made
+                continue
+            game_obj.moved = False
+            if game_obj.collision_cell:
+                remove_obj(*game_obj.collision_cell, game_obj)
+            if game_obj._is_collider:
+                add_obj(game_obj.collision.layer, position, game_obj)
+                moved_colliders.append(game_obj)
+            else:
+                game_obj.position = position
+        self.move_requests.clear()
+        collision = get_rb_collisions(single=True)
         unresolvable = []  # collisions between objects that have no previous location
         while collision:
             # save each collision event for oncollision calls
             # then reposition colliders to previous position in screen map
+            resolved = False
             for collider in collision.colliders:
-                resolved = False
-                other_colliders = collision.colliders.copy()
-                other_colliders.remove(collider)
-                rigidbody_collisions[collider.id].extend(other_colliders)
+                rigidbody_collisions[collider.id].extend(
+                    [other for other in collision.colliders if other is not collider]
+                )
             for collider in collision.colliders:
                 if collider.position != collision.position:
-                    self.collision_map.remove_obj(
-                        collision.layer, collision.position, collider
-                    )
-                    self.collision_map.add_obj(
-                        collision.layer, collider.position, collider
-                    )
+                    remove_obj(collision.layer, collision.position, collider)
+                    if collider.position:
+                        add_obj(collision.layer, collider.position, collider)
                     resolved = True
                     break
             if not resolved:
                 unresolvable.append(collision)
-            collision = self.collision_map.get_rb_collisions(single=True)
+            collision = get_rb_collisions(single=True)
             if collision and collision in unresolvable:
                 collision = None
-        for layer, position, game_obj_list in self.collision_map:
-            for game_obj in game_obj_list:
-                game_obj.position = position
+        for game_obj in moved_colliders:
+            if game_obj.collision_cell:
+                game_obj.position = game_obj.collision_cell[1]
 
+        # handlers run in order on the game loop thread, they are free to
+        # spawn, move and destroy objects
+        get_active = self.active_objects.get
         for game_obj_id, colliders in rigidbody_collisions.items():
-            game_obj = self.active_objects.get(game_obj_id)
+            game_obj = get_active(game_obj_id)
             if game_obj:
-                self.active_objects[game_obj_id].on_rigidbody_collision(colliders)
+                game_obj.on_rigidbody_collision(colliders)
+
+    def __draw_game_objects(self, cells: list[tuple[int, int, str]]) -> None:
+        """Add the sprite of all drawable objects to cells, in spawn order, if
+        they have a sprite and their screen position is within the screen
+        boundaries.
 
-    def __draw_game_objects(self) -> None:
-        """Draw all active objects to the screen if their screen position
-        is within the screen boundaries and update the screen map.
+        Args:
+            cells (list[tuple[int, int, str]]): (y, x, sprite) to draw this frame
         """
         game_obj: GameObject
-        objs_to_draw = []
-        self.collision_map = self.CollisionMap(self)
-        for game_obj_id, game_obj in self.active_objects.items():
-            # update screen_map
-            if game_obj.collision.collider:
-                self.collision_map.add_obj(
-                    game_obj.collision.layer, game_obj.position, game_obj
-                )
-            # find objects to draw
-            if game_obj.position and game_obj.current_sprite:
-                objs_to_draw.append(game_obj)
-        for game_obj in objs_to_draw:
-            y, x = game_obj.position
-            if (y >= 0 and y <= self.max_y - 1) and (x >= 0 and x <= self.max_x - 1):
-                sprite = game_obj.get_sprite()
-                self.screen.addstr(y, x, sprite)
-
-    def pathfind(self, game_obj, target_position):
-        def get_neighbors(position, max_y, max_x):
+        max_y = self.max_y - 1
+        max_x = self.max_x - 1
+        add_cell = cells.append
+        for game_obj in self.drawable.values():
+            position = game_obj.position
+            if not position or not game_obj.current_sprite:
+                continue
             y, x = position
-            neighbors = []
-            for neighbor in [(y + 1, x), (y - 1, x), (y, x + 1), (y, x - 1)]:
-                if neighbor[0] < 0 or neighbor[0] > max_y:
+            if 0 <= y <= max_y and 0 <= x <= max_x:
+                add_cell((y, x, game_obj.get_sprite()))
+
+    def __get_blocked_cells(self, game_obj: GameObject, width: int) -> bytearray:
+        """Build a flat grid (index y * width + x) marking the on screen cells
+        occupied by rigidbody colliders on game_obj's collision layer.
+
+        Args:
+            game_obj (GameObject): object that is pathfinding, never blocks itself
+            width (int): grid width
+
+        Returns:
+            bytearray: 1 for blocked cells, 0 for open cells
+        """
+        blocked = bytearray(width * (self.max_y + 1))
+        if not game_obj.collision.rigidbody:
+            return blocked
+        layer = game_obj.collision.layer
+        for key in self.collision_map.cells_by_layer.get(layer, ()):
+            for collider in self.collision_map.map[key]:
+                if collider is not game_obj and collider.collision.rigidbody:
+                    _, (y, x) = self.collision_map.unpack(key)
+                    if 0 <= y <= self.max_y and 0 <= x <= self.max_x:
+                        blocked[y * width + x] = 1
+                    break
+        return blocked
+
+    @staticmethod
+    def __astar(start: int, target: int, width: int, blocked: bytearray) -> list[int]:
+        """A* search over a flat grid of cells indexed by y * width + x.
+
+        Args:
+            start (int): start cell index
+            target (int): target cell index
+            width (int): grid width
+            blocked (bytearray): non zero for cells that can not be entered
+
+        Returns:
+            list[int]: parent cell index of each cell, -1 for unvisited cells
+        """
+        height = len(blocked) // width
+        target_y, target_x = divmod(target, width)
+        came_from = [-1] * len(blocked)
+        cost_so_far = [-1] * len(blocked)
+        came_from[start] = start
+        cost_so_far[start] = 0
+        frontier = [(0, start)]
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        while frontier:
+            _, current = heappop(frontier)
+            if current == target:
+                break
+            y, x = divmod(current, width)
+            new_cost = cost_so_far[current] + 1
+            for neighbor_y, neighbor_x in (
+                (y + 1, x),
+                (y - 1, x),
+                (y, x + 1),
+                (y, x - 1),
+            ):
+                if not (0 <= neighbor_y < height and 0 <= neighbor_x < width):
                     continue
-                elif neighbor[1] < 0 or neighbor[1] > max_x:
+                neighbor = neighbor_y * width + neighbor_x
+                if blocked[neighbor]:
                     continue
-                else:
-                    neighbors.append(neighbor)
-            return neighbors
-
-        frontier = PriorityQueue()
-        frontier.put(game_obj.position, 0)
-        came_from = dict()
-        cost_so_far = dict()
-        came_from[game_obj.position] = None
-        cost_so_far[game_obj.position] = 0
-
-        while not frontier.empty():
-            current = frontier.get()
-            if current == target_position:
-                break
-            for neighbor in get_neighbors(current, self.max_y, self.max_x):
-                new_cost = cost_so_far[current] + 1
-                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
+                if cost_so_far[neighbor] < 0 or new_cost < cost_so_far[neighbor]:
                     cost_so_far[neighbor] = new_cost
                     priority = new_cost + (
-                        abs(target_position[0] - game_obj.position[0])
-                        + abs(target_position[1] - game_obj.position[1])
+                        abs(target_y - neighbor_y) + abs(target_x - neighbor_x)
                     )
-                    frontier.put(neighbor, priority)
+                    heappush(frontier, (priority, neighbor))
                     came_from[neighbor] = current
-        current = target_position
+        return came_from
+
+    def pathfind(self, game_obj, target_position):
+        """Find a shortest path from game_obj's position to target_position
+        that avoids rigidbody colliders, if game_obj is a rigidbody itself.
+
+        Args:
+            game_obj (GameObject): object to find a path for
+            target_position (tuple[int, int]): position to reach
+
+        Returns:
+            list[tuple[int, int]]: positions to step through, excluding the start
+                                   position. Empty if the target is unreachable.
+        """
+        width = self.max_x + 1
+        start_y, start_x = game_obj.position
+        target_y, target_x = target_position
+        for y, x in (game_obj.position, target_position):
+            if not (0 <= y <= self.max_y and 0 <= x <= self.max_x):
+                return []
+        start = start_y * width + start_x
+        target = target_y * width + target_x
+        blocked = self.__get_blocked_cells(game_obj, width)
+        blocked[target] = 0
+        came_from = self.__astar(start, target, width, blocked)
+        if came_from[target] < 0:
+            return []
+        current = target
         path = []
-        while current != game_obj.position:
-            path.append(current)
+        while current != start:
+            path.append(divmod(current, width))
             current = came_from[current]
         path.reverse()
         return path
@@ -388,9 +689,11 @@ class TermGame:
             game_obj (GameObject): game object to destroy
         """
         del self.active_objects[game_obj.id]
-        self.collision_map.remove_obj(
-            game_obj.collision.layer, game_obj.position, game_obj
-        )
+        self.objects_by_label[game_obj.label].pop(game_obj.id, None)
+        self.__unregister_keys(game_obj)
+        del self.drawable[game_obj.id]
+        self.disable_collider(game_obj)
+        game_obj.moved = False
 
     def find_object_by_label(self, label: str) -> list[GameObject]:
         """Find all active GameObjects with the given label. Return a list
@@ -402,13 +705,7 @@ class TermGame:
         Returns:
             list[GameObject]: All active GameObjects with the given label.
         """
-        game_obj: GameObject
-
-        game_objs: list[GameObject] = []
-        for _, game_obj in self.active_objects.items():
-            if game_obj.label == label:
-                game_objs.append(game_obj)
-        return game_objs
+        return list(self.objects_by_label.get(label, {}).values())
 
     def get_objects_at_position(
         self, position: tuple[int, int], layer: int = None
@@ -423,13 +720,12 @@ class TermGame:
         Returns:
             dict[int, list[GameObject]]: Dictionary of layer : game object list pairs.
         """
-        specific_layer = layer
-        specific_position = position
+        collision_map = self.collision_map
+        layers = (layer,) if layer is not None else collision_map.cells_by_layer
         game_objs_dict = dict()
-        for layer, position, game_obj_list in self.collision_map:
-            if specific_layer and layer != specific_layer:
-                continue
-            if position == specific_position:
+        for layer in layers:
+            game_obj_list = collision_map.map.get(collision_map.pack(layer, position))
+            if game_obj_list:
                 game_objs_dict[layer] = game_obj_list
         return game_objs_dict
 